@@ -0,0 +1,78 @@
+import json
+import os
+from dataclasses import dataclass
+from typing import Final, Optional
+
+DEFAULT_CONFIG_PATH: Final[str] = "config.json"
+
+
+# SETTINGS FOR A SINGLE DISCORD SERVER
+@dataclass(frozen=True)
+class GuildProfile:
+    """
+    Holds the IDs the bot needs to work in one discord server (guild).
+    :param guild_id: The ID of the discord server
+    :param sheet_key: The key of the google spreadsheet holding the verified UINs for this server
+    :param verified_role_id: The ID of the role given to verified members
+    :param unverified_role_id: The ID of the role given to members who could not be verified
+    :param log_channel_id: The ID of the channel the bot logs its events to
+    :param events_channel_id: The ID of the channel weekly events are posted to, ``None`` to skip this server
+    """
+    guild_id: int
+    sheet_key: str
+    verified_role_id: int
+    unverified_role_id: int
+    log_channel_id: int
+    events_channel_id: Optional[int] = None
+
+
+# SETTINGS FOR THE WHOLE BOT PROCESS
+@dataclass(frozen=True)
+class BotConfig:
+    """
+    Holds the settings shared by every server the bot is running in.
+    :param token_env: The name of the environment variable holding the discord token
+    :param auto_shard: Whether the bot should let discord decide how many shards to run
+    :param owner_ids: The IDs of the users allowed to shut the bot down with ``!close``, which stops it in every server
+    :param guilds: The server profiles, keyed by guild ID
+    """
+    token_env: str
+    auto_shard: bool
+    owner_ids: frozenset[int]
+    guilds: dict[int, GuildProfile]
+
+
+def load_config(path: Optional[str] = None) -> BotConfig:
+    """
+    Reads the bot config file and turns it into a ``BotConfig``.
+    The path defaults to the ``BOT_CONFIG`` environment variable, or ``config.json`` if that is not set.
+    :param path: The path of the JSON config file
+    :return: The settings for the bot and every server it is running in
+    """
+    path = path or os.getenv("BOT_CONFIG", DEFAULT_CONFIG_PATH)
+    with open(path, encoding="utf-8") as file:
+        data: dict = json.load(file)
+
+    guilds: dict[int, GuildProfile] = {}
+    for entry in data.get("guilds", []):
+        profile = GuildProfile(
+            guild_id=int(entry["guild_id"]),
+            sheet_key=str(entry["sheet_key"]),
+            verified_role_id=int(entry["verified_role_id"]),
+            unverified_role_id=int(entry["unverified_role_id"]),
+            log_channel_id=int(entry["log_channel_id"]),
+            events_channel_id=int(entry["events_channel_id"]) if entry.get("events_channel_id") else None,
+        )
+        if profile.guild_id in guilds:
+            raise ValueError(f"Guild {profile.guild_id} is listed more than once in {path}")
+        guilds[profile.guild_id] = profile
+
+    if not guilds:
+        raise ValueError(f"No guilds are listed in {path}")
+
+    return BotConfig(
+        token_env=data.get("token_env", "DISCORD_TOKEN"),
+        auto_shard=bool(data.get("auto_shard", False)),
+        owner_ids=frozenset(int(owner_id) for owner_id in data.get("owner_ids", [])),
+        guilds=guilds,
+    )
@@ -3,9 +3,17 @@ from datetime import datetime, timedelta
 import requests
 from requests import Response
 
+# ONE HTTP SESSION SHARED BY EVERY SERVER THE BOT IS RUNNING IN
+session: requests.Session = requests.Session()
+REQUEST_TIMEOUT: float = 10.0  # Seconds to wait for the calendar before giving up
+
 
 def get_json_data(url: str) -> list[dict[str]]:
-    response: Response = requests.get(url)
+    try:
+        response: Response = session.get(url, timeout=REQUEST_TIMEOUT)
+    except requests.RequestException as e:
+        print('Failed to retrieve data:', e)
+        return []
     if response.status_code == 200:
         data: list[dict[str]] = response.json()  # Parse JSON data
         return data
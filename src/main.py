@@ -1,13 +1,15 @@
+import asyncio
 import os
 from datetime import datetime, timedelta
 from random import choice
-from typing import Final, Sequence
+from typing import Final, Optional
 
 import discord
 from discord import Intents, Client, Message, Role
 from discord.ext import commands, tasks
 from dotenv import load_dotenv
 
+from config import BotConfig, GuildProfile, load_config
 from events import get_json_data, get_weekly_events, get_event_data
 from responses import get_verification
 
@@ -46,9 +48,16 @@ class VerifyModal(discord.ui.Modal):
         first = self.children[0].value
         last = self.children[1].value
         uin = self.children[2].value
-        if first.isalpha() and last.isalpha() and uin.isnumeric():
-            response: str = get_verification((str(first), str(last), str(uin)))
-            await interaction.response.send_message(f"{response}", ephemeral=True)
+        profile: Optional[GuildProfile] = get_profile(self.author)
+        if profile is None:
+            await interaction.response.send_message("Verification is not set up for this server", ephemeral=True)
+        elif first.isalpha() and last.isalpha() and uin.isnumeric():
+            # Reading the sheet can take longer than discord waits for a reply, so reply later
+            await interaction.response.defer(ephemeral=True)
+            response: str = await asyncio.to_thread(
+                get_verification, (str(first), str(last), str(uin)), profile.sheet_key
+            )
+            await interaction.followup.send(f"{response}", ephemeral=True)
             await change_verification(response, (first, last, self.author))
         else:
             await interaction.response.send_message(
@@ -58,22 +67,95 @@ class VerifyModal(discord.ui.Modal):
             )
 
 
-# LOAD TOKEN
+# LOAD TOKEN AND SERVER PROFILES
 load_dotenv()
-TOKEN: Final[str] = os.getenv("DISCORD_TOKEN")
+CONFIG: Final[BotConfig] = load_config()
+TOKEN: Final[str] = os.getenv(CONFIG.token_env)
 
 # BOT SETUP
 intents: Intents = Intents.default()
 intents.message_content = True  # NOQA
 intents.members = True  # Required for Server Members Intent
-client: Client = commands.Bot(command_prefix="!", intents=intents)
-bot_log: discord.TextChannel = ...
-bot_log_channel_id: int = 1257438488219881613
-events_channel_id: int = 1168646941391978626
+bot_class = commands.AutoShardedBot if CONFIG.auto_shard else commands.Bot
+client: Client = bot_class(command_prefix="!", intents=intents)
+
+# LOOKUP TABLES KEYED BY GUILD ID, FILLED IN ONCE THE BOT IS READY
+log_channels: dict[int, discord.TextChannel] = {}
+events_channels: dict[int, discord.TextChannel] = {}
+verified_roles: dict[int, Role] = {}
+unverified_roles: dict[int, Role] = {}
+
+
+def get_profile(user: discord.abc.User) -> Optional[GuildProfile]:
+    """
+    Finds the profile for the server a user is in, as long as its channels and roles were found.
+    :param user: The discord member we want the server profile of
+    :return: The server profile, or ``None`` if the user is not in a server the bot is set up for
+    """
+    guild: Optional[discord.Guild] = getattr(user, "guild", None)
+    if guild is None or guild.id not in verified_roles:
+        return None
+    return CONFIG.guilds.get(guild.id)
+
+
+def resolve_guilds() -> None:
+    """
+    Looks up the channels and roles listed in every server profile and stores them by guild ID,
+    so they do not have to be searched for each time they are used.
+    Servers that are not available yet are resolved later by ``on_guild_available``.
+    :return: None
+    """
+    for guild_id in CONFIG.guilds:
+        guild: Optional[discord.Guild] = client.get_guild(guild_id)
+        if guild is None:
+            print(f"Could not find guild {guild_id} yet, it will be set up once it is available")
+            continue
+        resolve_guild(guild)
+
+
+def resolve_guild(guild: discord.Guild) -> bool:
+    """
+    Looks up the channels and roles listed in one server's profile and stores them by guild ID.
+    If any of the IDs are wrong the server is left out of the lookup tables, so the bot never
+    tries to use a channel or role that does not exist.
+    :param guild: The discord server being set up
+    :return: ``True`` if every ID in the profile was found, ``False`` otherwise
+    """
+    profile: Optional[GuildProfile] = CONFIG.guilds.get(guild.id)
+    if profile is None:
+        return False
+
+    log_channel = guild.get_channel(profile.log_channel_id)
+    events_channel = guild.get_channel(profile.events_channel_id) if profile.events_channel_id else None
+    verified_role: Optional[Role] = guild.get_role(profile.verified_role_id)
+    unverified_role: Optional[Role] = guild.get_role(profile.unverified_role_id)
+
+    problems: list[str] = []
+    if not isinstance(log_channel, discord.TextChannel):
+        problems.append(f"log_channel_id {profile.log_channel_id}")
+    if profile.events_channel_id and not isinstance(events_channel, discord.TextChannel):
+        problems.append(f"events_channel_id {profile.events_channel_id}")
+    if verified_role is None:
+        problems.append(f"verified_role_id {profile.verified_role_id}")
+    if unverified_role is None:
+        problems.append(f"unverified_role_id {profile.unverified_role_id}")
+
+    for table in (log_channels, events_channels, verified_roles, unverified_roles):
+        table.pop(guild.id, None)
+    if problems:
+        print(f"Skipping guild {guild.id} ({guild.name}), could not find: {', '.join(problems)}")
+        return False
+
+    log_channels[guild.id] = log_channel
+    if events_channel is not None:
+        events_channels[guild.id] = events_channel
+    verified_roles[guild.id] = verified_role
+    unverified_roles[guild.id] = unverified_role
+    return True
 
 
 # SLASH COMMANDS
-@client.slash_command()
+@client.slash_command(guild_ids=list(CONFIG.guilds))
 async def verify(ctx: discord.ApplicationContext) -> None:
     """
     Prompts form for members to verify their
@@ -97,13 +179,11 @@ async def change_verification(response: str, user_info: tuple[str, str, discord.
     try:
         member: discord.Member = user_info[2]
         guild_id: int = member.guild.id
-        guild_roles: Sequence[Role] = client.get_guild(guild_id).roles
-        verified_role: discord.Role = discord.utils.get(
-            guild_roles, name="VERIFIED"
-        )
-        unverified_role: discord.Role = discord.utils.get(
-            guild_roles, name="Unverified"
-        )
+        if guild_id not in verified_roles:
+            await log_event(f"Could not verify [{member}] because this server's profile is not set up", guild_id)
+            return
+        verified_role: discord.Role = verified_roles[guild_id]
+        unverified_role: discord.Role = unverified_roles[guild_id]
 
         if response == "Verified!":
             await remove_role(member, unverified_role)
@@ -114,7 +194,7 @@ async def change_verification(response: str, user_info: tuple[str, str, discord.
             await add_role(member, unverified_role)
             await set_nick(member, (user_info[0].title(), user_info[1].title()))
     except Exception as e:
-        await log_event(f"Could not verify [{user_info[2]}] due to ``{e}``")
+        await log_event(f"Could not verify [{user_info[2]}] due to ``{e}``", user_info[2].guild.id)
 
 
 # BOT LOGIC TO CHANGE MEMBER'S DETAILS
@@ -128,10 +208,11 @@ async def set_nick(user: discord.Member, name: tuple[str, str]) -> None:
     nickname = " ".join(name)
     try:
         await user.edit(nick=nickname)
-        await log_event(f'Changing [{user}] nickname to "{nickname}"')
+        await log_event(f'Changing [{user}] nickname to "{nickname}"', user.guild.id)
     except Exception as e:
         await log_event(
-            f'Could not change [{user}] nickname to "{nickname}" due to ``{str(e)[str(e).rindex(":") + 2:]}``'
+            f'Could not change [{user}] nickname to "{nickname}" due to ``{str(e)[str(e).rindex(":") + 2:]}``',
+            user.guild.id
         )
 
 
@@ -145,14 +226,14 @@ async def add_role(user: discord.Member, role: discord.Role) -> None:
     if role not in user.roles:
         try:
             await user.add_roles(role)
-            await log_event(f'"{role}" role added to [{user}]')
+            await log_event(f'"{role}" role added to [{user}]', user.guild.id)
         except Exception as e:
             await log_event(
-                f'"{role}" could not be added to [{user}] due to ``{str(e)[str(e).rindex(":") + 2:]}``'
+                f'"{role}" could not be added to [{user}] due to ``{str(e)[str(e).rindex(":") + 2:]}``', user.guild.id
             )
     else:
         await log_event(
-            f'Tried to add role "{role}" to [{user}], but they already had that role'
+            f'Tried to add role "{role}" to [{user}], but they already had that role', user.guild.id
         )
 
 
@@ -166,14 +247,14 @@ async def remove_role(user: discord.Member, role: discord.Role) -> None:
     if role in user.roles:
         try:
             await user.remove_roles(role)
-            await log_event(f'"{role}" role removed from [{user}]')
+            await log_event(f'"{role}" role removed from [{user}]', user.guild.id)
         except Exception as e:
             await log_event(
-                f'"{role}" role could not be removed from [{user}] due to ``{str(e)[str(e).rindex(":") + 2:]}``'
+                f'"{role}" role could not be removed from [{user}] due to ``{str(e)[str(e).rindex(":") + 2:]}``', user.guild.id
             )
     else:
         await log_event(
-            f'Tried to remove role "{role}" from [{user}], but they never had that role'
+            f'Tried to remove role "{role}" from [{user}], but they never had that role', user.guild.id
         )
 
 
@@ -186,32 +267,40 @@ async def on_message(message: Message) -> None:
     :param message: The discord message sent by a user
     :return: None
     """
-    if message.author == client.user:
+    if message.author == client.user or message.guild is None or message.guild.id not in CONFIG.guilds:
         return
 
     username: str = str(message.author)
     user_message: str = message.content
     # channel: str = str(message.channel)
-    roles: str = str(message.author.roles)
+    guild_id: int = message.guild.id
 
     if user_message == "!close":
         await message.delete()
-        if "OffiStars" in roles:
+        if message.author.id in CONFIG.owner_ids:
             await manual_disconnect()
         else:
-            await log_event(f"**[{username}]** attempted to shut me down")
+            await log_event(f"**[{username}]** attempted to shut me down", guild_id)
 
 
 # LOG IMPORTANT EVENTS TO BOT-ALERTS
-async def log_event(event: str) -> None:
+async def log_event(event: str, guild_id: Optional[int] = None) -> None:
     """
     Sends a message of significant bot ``events`` to the log.
     :param event: String of the event we want to log
+    :param guild_id: The server the event happened in, ``None`` to log it in every server
     :return: None
     """
     current_time: datetime = datetime.now()
-    global bot_log
-    await bot_log.send(f">>> {event} \n``{current_time:[%m.%d.%y %H:%M]}``", silent=True)
+    if guild_id is None:
+        channels = list(log_channels.values())
+    else:
+        channels = [log_channels[guild_id]] if guild_id in log_channels else []
+    for bot_log in channels:
+        try:
+            await bot_log.send(f">>> {event} \n``{current_time:[%m.%d.%y %H:%M]}``", silent=True)
+        except Exception as e:
+            print(f"Could not log to [{bot_log}] in guild {bot_log.guild.id} due to {e}")
 
 
 # HANDLING STARTUP FOR BOT
@@ -219,11 +308,33 @@ async def log_event(event: str) -> None:
 async def on_ready() -> None:
     await client.wait_until_ready()
     await client.change_presence(activity=discord.Game("Verifying ✅"))
-    global bot_log
-    bot_log = client.get_channel(bot_log_channel_id)
+    resolve_guilds()
     await log_event(f"### [{str(client.user)[:-5]}] is now running!")
 
 
+# HANDLING SERVERS THAT BECOME AVAILABLE AFTER STARTUP
+@client.event
+async def on_guild_available(guild: discord.Guild) -> None:
+    """
+    Sets up a server that was not available when the bot started, which is common when sharding.
+    :param guild: The discord server that just became available
+    :return: None
+    """
+    if guild.id in CONFIG.guilds and guild.id not in log_channels:
+        resolve_guild(guild)
+
+
+@client.event
+async def on_guild_join(guild: discord.Guild) -> None:
+    """
+    Sets up a server from the config once the bot has been added to it.
+    :param guild: The discord server the bot just joined
+    :return: None
+    """
+    if guild.id in CONFIG.guilds:
+        resolve_guild(guild)
+
+
 # HANDLING DISCONNECTIONS
 @client.event
 async def on_close() -> None:
@@ -254,24 +365,28 @@ async def send_weekly_events() -> None:
     :return: None
     """
     await client.wait_until_ready()
-    channel = client.get_channel(events_channel_id)
     current_date: datetime = datetime.now() + timedelta(days=1)
     end_date: datetime = current_date + timedelta(days=6)
     start_date_str = current_date.strftime('%m/%d')
     end_date_str = end_date.strftime('%m/%d')
     if current_date.weekday() == 0:  # Check if it's Sunday
         calendar_url = 'https://calendar.tamu.edu/live/json/events/group/College%20of%20Engineering'
-        json_data = get_json_data(calendar_url)
+        json_data = await asyncio.to_thread(get_json_data, calendar_url)
         weekly_events = get_weekly_events(json_data)
 
-        await channel.send(f">>> # Upcoming Events for the Week:\n"
-                           f"## `{start_date_str} - {end_date_str}`\n", silent=True)
-        if weekly_events:
-            for event in weekly_events:
-                event_information = get_event_data(event)
-                await channel.send(event_information, silent=True)
-        else:
-            await channel.send(">>> ## No upcoming events for the week.", silent=True)
+        events_information: list[str] = [get_event_data(event) for event in weekly_events]
+
+        for guild_id, channel in list(events_channels.items()):
+            try:
+                await channel.send(f">>> # Upcoming Events for the Week:\n"
+                                   f"## `{start_date_str} - {end_date_str}`\n", silent=True)
+                if events_information:
+                    for event_information in events_information:
+                        await channel.send(event_information, silent=True)
+                else:
+                    await channel.send(">>> ## No upcoming events for the week.", silent=True)
+            except Exception as e:
+                await log_event(f"Could not send the weekly events to [{channel}] due to ``{e}``", guild_id)
 
 
 # MAIN ENTRY POINT
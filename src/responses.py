@@ -1,3 +1,7 @@
+from threading import Lock
+from time import monotonic
+from typing import Final, Optional
+
 import gspread
 from oauth2client.service_account import ServiceAccountCredentials
 
@@ -7,34 +11,100 @@ SCOPES = [
     "https://www.googleapis.com/auth/drive.file",
     "https://www.googleapis.com/auth/drive",
 ]
+UIN_CACHE_SECONDS: Final[float] = 300.0
+UIN_REFRESH_SECONDS: Final[float] = 20.0  # Shortest wait before a UIN that was not found reads the sheet again
+
+# SHARED BY EVERY SERVER THE BOT IS RUNNING IN
+sheets_client: Optional[gspread.Client] = None
+uin_cache: dict[str, tuple[float, set[str]]] = {}  # sheet key -> (time read, UINs)
+sheet_locks: dict[str, Lock] = {}  # sheet key -> lock held while that sheet is read
+sheet_locks_lock: Lock = Lock()
 
 
 # LOGIC TO SAY WHETHER TO VERIFY A MEMBER
-def get_verification(user_input: tuple[str, str, str]) -> str:
+def get_verification(user_input: tuple[str, str, str], sheet_key: str) -> str:
     """
     Returns a string saying whether the user should be verified or not.
     :param user_input: Message containing the information needed to verify the member
+    :param sheet_key: The key of the spreadsheet holding the verified UINs for the member's server
     :return: ``Verified!`` or ``NOT Verified!`` depending on whether the user meets the requirements to be verified
     """
-    if check_verification(user_input[-1]):
+    if check_verification(user_input[-1], sheet_key):
         return "Verified!"
     else:
         return "NOT Verified!"
 
 
 # CHECKS IF A MEMBER TRYING TO VERIFY IS A PART OF THE VERIFICATION LIST
-def check_verification(student_uin: str) -> bool:
+def check_verification(student_uin: str, sheet_key: str) -> bool:
     """
     Reads through the data sheet containing information about verified users and returns whether
     the user is one of those verified people.
+    UINs are cached per sheet. The sheet is read again once the cache is older than ``UIN_CACHE_SECONDS``,
+    or when the UIN is missing and the cache is older than ``UIN_REFRESH_SECONDS``, so people who just
+    filled out the form can verify quickly without repeated wrong UINs using up the sheets quota.
+    This blocks while the sheet is read, so call it from a thread when running inside the bot.
     :param student_uin: Number used to identify and differentiate users, this is what is checked against the data file
+    :param sheet_key: The key of the spreadsheet holding the verified UINs
     :return: ``True`` if the user is one of those verified users, ``False`` otherwise
     """
-    creds = ServiceAccountCredentials.from_json_keyfile_name("credentials.json", SCOPES)
-    client = gspread.authorize(creds)
-    sheet = client.open(
-        "Texas A&M Engineering Academies Ambassadors Discord Access Form (Responses)"
-    ).sheet1
-    student_uins = set(sheet.col_values(2)[1:])
+    cached_result: Optional[bool] = check_cache(student_uin, sheet_key)
+    if cached_result is not None:
+        return cached_result
+
+    # Only one read per sheet at a time, anyone waiting on it uses the result once it is cached
+    with get_sheet_lock(sheet_key):
+        cached_result = check_cache(student_uin, sheet_key)
+        if cached_result is not None:
+            return cached_result
+        return student_uin in read_uins(sheet_key)
+
+
+def check_cache(student_uin: str, sheet_key: str) -> Optional[bool]:
+    """
+    Checks a UIN against the cached copy of a spreadsheet.
+    :param student_uin: The UIN being checked
+    :param sheet_key: The key of the spreadsheet holding the verified UINs
+    :return: Whether the UIN is on the sheet, or ``None`` if the sheet needs to be read again to know
+    """
+    cached: Optional[tuple[float, set[str]]] = uin_cache.get(sheet_key)
+    if cached is None:
+        return None
+    age: float = monotonic() - cached[0]
+    if age < UIN_CACHE_SECONDS and (student_uin in cached[1] or age < UIN_REFRESH_SECONDS):
+        return student_uin in cached[1]
+    return None
+
+
+def get_sheet_lock(sheet_key: str) -> Lock:
+    """
+    Returns the lock for a spreadsheet, creating it the first time it is needed.
+    :param sheet_key: The key of the spreadsheet
+    :return: The lock held while that spreadsheet is being read
+    """
+    with sheet_locks_lock:
+        return sheet_locks.setdefault(sheet_key, Lock())
+
 
-    return student_uin in student_uins
+def read_uins(sheet_key: str) -> set[str]:
+    """
+    Reads the UIN column of a spreadsheet and stores it in the cache.
+    :param sheet_key: The key of the spreadsheet holding the verified UINs
+    :return: Every UIN on the spreadsheet
+    """
+    sheet = get_sheets_client().open_by_key(sheet_key).sheet1
+    student_uins: set[str] = set(sheet.col_values(2)[1:])
+    uin_cache[sheet_key] = (monotonic(), student_uins)
+    return student_uins
+
+
+def get_sheets_client() -> gspread.Client:
+    """
+    Returns the google sheets client, authorizing it the first time it is needed.
+    :return: The google sheets client shared by every server
+    """
+    global sheets_client
+    if sheets_client is None:
+        creds = ServiceAccountCredentials.from_json_keyfile_name("credentials.json", SCOPES)
+        sheets_client = gspread.authorize(creds)
+    return sheets_client